@@ -1,70 +1,133 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import asyncio
+import logging
+import queue
+import sys
 from pathlib import Path
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy.engine import make_url
 
-from app.routes import auth, meetings, files, user_settings 
-from app.models.database import database    
-from app.config import settings  # Make sure this import exists
-
+from app.models.database import database, DATABASE_URL
+from app.config import settings, validate_api_keys
+from app.utils.upload_limit import UploadSizeLimitMiddleware
+from app.utils.compression import StreamingAwareGZipMiddleware
 
+# Records are queued by the caller and written to stderr by a listener thread,
+# so a slow or piped stderr never blocks the event loop
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+log_listener = QueueListener(log_queue, log_handler)
+# Attached directly rather than via basicConfig, which would give the QueueHandler a
+# formatter too and format every record twice
+root_logger = logging.getLogger()
+root_logger.addHandler(QueueHandler(log_queue))
+root_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Create uploads directory if it doesn't exist
 uploads_dir = Path("uploads")
 uploads_dir.mkdir(exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the database on startup and close it on shutdown"""
+    # Started and stopped with the app, so every lifespan gets a running listener;
+    # records logged before startup wait in the queue until then
+    log_listener.start()
+    try:
+        logger.info("Starting Meeting Copilot API...")
+        validate_api_keys()
+        
+        # Connect to database, then create tables and warm the pool concurrently
+        await database.connect()
+        startup_tasks = [database.warm(settings.DB_POOL_SIZE)]
+        # Skip the per-table existence checks on production boots unless asked for
+        if settings.RUN_CREATE_ALL or settings.ENVIRONMENT != "production":
+            startup_tasks.append(database.create_all())
+        await asyncio.gather(*startup_tasks)
+        logger.info("Database initialized successfully")
+        
+        logger.info("Meeting Copilot API is ready!")
+        
+        yield
+        
+        from app.routes.meetings import transcription_service
+        from app.services.jobs import job_runner
+        from app.utils.helpers import flush_meeting_data
+        await job_runner.shutdown()
+        await flush_meeting_data()
+        await transcription_service.close()
+        await database.disconnect()
+        logger.info("Database disconnected")
+    finally:
+        log_listener.stop()
+
+# Every API router is mounted under this prefix
+API_PREFIX = "/api"
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Meeting Copilot API",
     description="AI-powered meeting transcription and summarization with user authentication",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
-# Add this temporarily to your main.py to debug:
-print(f"Database URL: {settings.DATABASE_URL}")
+# Only the driver is logged - the URL itself carries credentials
+logger.debug("Database URL configured (driver=%s)", make_url(DATABASE_URL).drivername)
+# Refuse oversized uploads from Content-Length alone, before any body bytes are parsed.
+# Added before CORS so the 413 still carries CORS headers
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_size=settings.MAX_FILE_SIZE,
+    path_prefix=f"{API_PREFIX}/meetings/upload"
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"] if settings.DEBUG else ["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With", "Content-Range"],
+    expose_headers=["Upload-Offset"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Compress large JSON responses - added last so it is the outermost middleware.
+# SSE endpoints are skipped so events are delivered as they happen
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Setup templates
-templates = Jinja2Templates(directory="templates")
-
-# Include routers - Authentication routes first
-app.include_router(auth.router, prefix="/api", tags=["auth"])
-app.include_router(meetings.router, prefix="/api", tags=["meetings"])
-app.include_router(files.router, prefix="/api", tags=["files"])
-app.include_router(user_settings.router, prefix="/api", tags=["settings"])
-
-# Database startup and shutdown events
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database and start auto upload watcher"""
-    print("Starting Meeting Copilot API...")
-    
-    # Connect to database
-    await database.connect()
-    await database.create_all()
-    print("Database initialized successfully")
-    
-    # Start the auto-upload watcher if enabled
-   
-    
-    print("Meeting Copilot API is ready!")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close database connection on shutdown"""
-    await database.disconnect()
-    print("Database disconnected")
+# Setup templates - compiled templates are cached on disk and only re-checked in debug
+templates = Jinja2Templates(
+    directory="templates",
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=settings.DEBUG,
+    cache_size=400
+)
+
+def register_routers(app: FastAPI):
+    """Import and mount the API routers"""
+    from app.routes import auth, meetings, files, user_settings
+
+    # Authentication routes first
+    app.include_router(auth.router, prefix=API_PREFIX, tags=["auth"])
+    app.include_router(meetings.router, prefix=API_PREFIX, tags=["meetings"])
+    app.include_router(files.router, prefix=API_PREFIX, tags=["files"])
+    app.include_router(user_settings.router, prefix=API_PREFIX, tags=["settings"])
+
+register_routers(app)
 
 @app.get("/")
 async def read_root(request: Request):
@@ -95,5 +158,11 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG  # Only reload in debug mode
+        reload=settings.DEBUG,  # Only reload in debug mode
+        # One process: the generated JWT secret (when SECRET_KEY is unset), background jobs,
+        # progress events and caches all live in process memory and aren't shared across workers
+        workers=1,
+        # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
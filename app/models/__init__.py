@@ -1,14 +1,25 @@
-from .database import database, metadata, engine
-from .meeting import Meeting, MeetingParticipant, MeetingTranscript, MeetingSummary
-from .user import User  # Import User from user.py, not meeting.py
+import importlib
 
-__all__ = [
-    "database",
-    "metadata", 
-    "engine",
-    "Meeting",
-    "MeetingParticipant",
-    "MeetingTranscript", 
-    "MeetingSummary",
-    "User"
-]
\ No newline at end of file
+# Resolved on first attribute access (PEP 562) so importing app.models stays cheap
+_lazy = {
+    "database": ".database",
+    "metadata": ".database",
+    "engine": ".database",
+    "Meeting": ".meeting",
+    "MeetingParticipant": ".meeting",
+    "MeetingTranscript": ".meeting",
+    "MeetingSummary": ".meeting",
+    "User": ".user",  # User lives in user.py, not meeting.py
+    "TranscriptCache": ".transcript_cache",
+    "UploadBlob": ".upload_blob",
+}
+
+__all__ = list(_lazy)
+
+def __getattr__(name):
+    if name in _lazy:
+        module = importlib.import_module(_lazy[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
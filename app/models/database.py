@@ -1,7 +1,15 @@
+import asyncio
+import logging
 import os
-from sqlalchemy import MetaData, text
+from sqlalchemy import MetaData, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
 
 # Default to SQLite
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./app.db")
@@ -10,16 +18,65 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./app.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
 
-# Create engine
-engine = create_async_engine(DATABASE_URL, echo=False)
+# asyncpg: keep prepared statements per connection and skip JIT, which only
+# slows down the short OLTP queries this app runs. SQLAlchemy prepares statements
+# itself through its own per-connection LRU, so that is the cache to size - asyncpg's
+# statement_cache_size is bypassed
+connect_args = {}
+if make_url(DATABASE_URL).get_driver_name() == "asyncpg":
+    connect_args = {
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off", "application_name": "meeting-copilot"},
+    }
+
+# Create engine - SQLite gets no pooling, server databases get a sized async pool
+if DATABASE_URL.startswith("sqlite"):
+    engine = create_async_engine(DATABASE_URL, echo=False, poolclass=NullPool)
+
+    # SQLite only enforces foreign keys (and ON DELETE CASCADE) when asked, per connection
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+else:
+    engine = create_async_engine(
+        DATABASE_URL,
+        echo=False,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE or 20,
+        max_overflow=settings.DB_MAX_OVERFLOW or 20,
+        pool_timeout=30,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-metadata = MetaData()
+# Deterministic constraint/index names so migrations and reflection match existing schema
+metadata = MetaData(naming_convention={
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+})
 Base = declarative_base(metadata=metadata)
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
+async def warm_connection_pool(pool_size: int):
+    """Open and ping pool_size connections concurrently so the first burst doesn't pay setup cost"""
+    if DATABASE_URL.startswith("sqlite") or pool_size <= 0:
+        return
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*[_ping() for _ in range(pool_size)])
+
 class Database:
     def __init__(self):
         self.engine = engine
@@ -28,9 +85,15 @@ class Database:
         try:
             async with self.engine.begin() as conn:
                 await conn.execute(text("SELECT 1"))
-            print("Database connected successfully")
+            logger.info("Database connected successfully")
+        except Exception as e:
+            logger.error("Database connection error: %s", e)
+        
+    async def warm(self, pool_size: int):
+        try:
+            await warm_connection_pool(pool_size)
         except Exception as e:
-            print(f"Database connection error: {e}")
+            logger.warning("Connection pool warm-up error: %s", e)
         
     async def disconnect(self):
         await self.engine.dispose()
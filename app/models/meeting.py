@@ -1,8 +1,9 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional, TYPE_CHECKING, List
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Float, JSON
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Float, JSON, Index, Uuid, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
+import time
 import uuid
 
 from .database import Base
@@ -29,9 +30,14 @@ class MeetingPlatform(str, Enum):
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        # Serves "meetings for user ordered by created_at desc"
+        Index("ix_meetings_user_id_created_at", "user_id", "created_at"),
+    )
     
     # Use consistent style - choose either all Column or all Mapped
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    # Native UUID on PostgreSQL (16 bytes), CHAR(32) on SQLite - run migrate_meeting_ids.py on older databases
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
     
     # Meeting details
@@ -67,27 +73,36 @@ class Meeting(Base):
     transcription_status: Mapped[str] = mapped_column(String(50), default="pending")
     summary_status: Mapped[str] = mapped_column(String(50), default="pending")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Changes on every insert and update (ORM and Core) - timestamps above are only
+    # second-resolution on SQLite, so this is what list ETags are built from
+    revision: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=time.time_ns, onupdate=time.time_ns, server_default="0"
+    )
     
-    # Relationships - use consistent style
+    # Relationships - child collections must be loaded explicitly (selectinload) and
+    # are deleted by the database via ON DELETE CASCADE
     user: Mapped["User"] = relationship("User", back_populates="meetings")
     participants: Mapped[List["MeetingParticipant"]] = relationship(
-        "MeetingParticipant", back_populates="meeting", cascade="all, delete-orphan"
+        "MeetingParticipant", back_populates="meeting", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise_on_sql"
     )
     # Consider removing one of these if you don't need both
     transcripts: Mapped[List["MeetingTranscript"]] = relationship(
-        "MeetingTranscript", back_populates="meeting", cascade="all, delete-orphan"
+        "MeetingTranscript", back_populates="meeting", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise_on_sql"
     )
     summaries: Mapped[List["MeetingSummary"]] = relationship(
-        "MeetingSummary", back_populates="meeting", cascade="all, delete-orphan"
+        "MeetingSummary", back_populates="meeting", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise_on_sql"
     )
 
 class MeetingParticipant(Base):
     __tablename__ = "meeting_participants"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    meeting_id: Mapped[str] = mapped_column(String(36), ForeignKey("meetings.id"), nullable=False)
+    meeting_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True)
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -98,7 +113,7 @@ class MeetingParticipant(Base):
     is_host: Mapped[bool] = mapped_column(Boolean, default=False)
     is_agent: Mapped[bool] = mapped_column(Boolean, default=False)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     meeting: Mapped["Meeting"] = relationship("Meeting", back_populates="participants")
 
@@ -106,7 +121,7 @@ class MeetingTranscript(Base):
     __tablename__ = "meeting_transcripts"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    meeting_id: Mapped[str] = mapped_column(String(36), ForeignKey("meetings.id"), nullable=False)
+    meeting_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True)
     
     speaker_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     speaker_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -116,7 +131,7 @@ class MeetingTranscript(Base):
     confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     language: Mapped[str] = mapped_column(String(10), default="en")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     meeting: Mapped["Meeting"] = relationship("Meeting", back_populates="transcripts")
 
@@ -124,7 +139,7 @@ class MeetingSummary(Base):
     __tablename__ = "meeting_summaries"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    meeting_id: Mapped[str] = mapped_column(String(36), ForeignKey("meetings.id"), nullable=False)
+    meeting_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True)
     
     summary_type: Mapped[str] = mapped_column(String(50), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -132,6 +147,6 @@ class MeetingSummary(Base):
     ai_model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     processing_time_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     meeting: Mapped["Meeting"] = relationship("Meeting", back_populates="summaries")
\ No newline at end of file
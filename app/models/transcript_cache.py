@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .database import Base
+
+class TranscriptCache(Base):
+    """Transcripts keyed by a hash of the Whisper model and the audio bytes"""
+    __tablename__ = "transcript_cache"
+    
+    id: Mapped[int] = mapped_column(primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    transcription_text: Mapped[str] = mapped_column(Text, nullable=False)
+    
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
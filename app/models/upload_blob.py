@@ -0,0 +1,18 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import String, BigInteger, DateTime, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .database import Base
+
+class UploadBlob(Base):
+    """Uploaded audio stored once per user by SHA-256; any number of that user's meetings may point at it"""
+    __tablename__ = "upload_blobs"
+    
+    # Keyed per user - knowing a digest must never grant access to someone else's audio
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
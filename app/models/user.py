@@ -28,7 +28,9 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
         "Meeting", 
         back_populates="user", 
         cascade="all, delete-orphan",
-        lazy="selectin"  # Optional: controls how relationships are loaded
+        # Load on demand - the user is fetched on every authenticated request, and
+        # eager-loading here pulled every meeting (with transcripts) each time
+        lazy="select"
     )
 
     zoom_recordings_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
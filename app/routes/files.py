@@ -1,7 +1,12 @@
+import asyncio
 import os
+import aiofiles.os
+import time
+from collections import OrderedDict
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Any
 
 from app.models.user import User
@@ -10,6 +15,49 @@ from app.services.oauth_service import current_active_user
 
 router = APIRouter(prefix="/files", tags=["Files"])
 
+VALID_EXTENSIONS = frozenset({'.mp3', '.mp4', '.wav', '.m4a', '.mov', '.avi'})
+
+# Listing cache keyed by (user, folder, folder mtime) - a new file bumps the folder
+# mtime and therefore the key, the TTL covers files rewritten in place
+LISTING_CACHE_TTL = 10
+LISTING_CACHE_MAX_ENTRIES = 256
+_listing_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+def _get_cached_listing(key: tuple):
+    cached = _listing_cache.get(key)
+    if cached is None:
+        return None
+    expires_at, files = cached
+    if expires_at < time.monotonic():
+        _listing_cache.pop(key, None)
+        return None
+    _listing_cache.move_to_end(key)
+    return files
+
+def _set_cached_listing(key: tuple, files: List[Dict[str, Any]]):
+    _listing_cache[key] = (time.monotonic() + LISTING_CACHE_TTL, files)
+    _listing_cache.move_to_end(key)
+    while len(_listing_cache) > LISTING_CACHE_MAX_ENTRIES:
+        _listing_cache.popitem(last=False)
+
+def _scan_recordings(path: str) -> List[Dict[str, Any]]:
+    """Blocking directory scan; run off the event loop via asyncio.to_thread"""
+    files = []
+    # scandir caches one stat per entry instead of isfile/getsize/getmtime each stat-ing
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() not in VALID_EXTENSIONS or not entry.is_file():
+                continue
+            
+            st = entry.stat()
+            files.append({
+                "name": entry.name,
+                "size": st.st_size,
+                "mtime": st.st_mtime,
+                "path": entry.path
+            })
+    return files
+
 @router.get("/list")
 async def list_recordings(
     user: User = Depends(current_active_user),
@@ -21,27 +69,29 @@ async def list_recordings(
     if not user.zoom_recordings_path:
         raise HTTPException(status_code=400, detail="No recording path configured")
     
-    if not os.path.exists(user.zoom_recordings_path):
+    if not await aiofiles.os.path.exists(user.zoom_recordings_path):
         raise HTTPException(status_code=404, detail="Recording path not found")
     
-    files = []
-    valid_extensions = ('.mp3', '.mp4', '.wav', '.m4a', '.mov', '.avi')
-    
     try:
-        for filename in os.listdir(user.zoom_recordings_path):
-            file_path = os.path.join(user.zoom_recordings_path, filename)
-            if (os.path.isfile(file_path) and 
-                filename.lower().endswith(valid_extensions)):
-                
-                files.append({
-                    "name": filename,
-                    "size": os.path.getsize(file_path),
-                    "modified": datetime.fromtimestamp(os.path.getmtime(file_path)),
-                    "path": file_path
-                })
+        folder_mtime = (await aiofiles.os.stat(user.zoom_recordings_path)).st_mtime_ns
+        cache_key = (user.id, user.zoom_recordings_path, folder_mtime)
+        files = _get_cached_listing(cache_key)
+        if files is None:
+            files = await asyncio.to_thread(_scan_recordings, user.zoom_recordings_path)
+            # Sort on the raw float mtime and only build datetimes for the response
+            files.sort(key=itemgetter("mtime"), reverse=True)
+            _set_cached_listing(cache_key, files)
     except PermissionError:
         raise HTTPException(status_code=403, detail="Permission denied accessing folder")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading folder: {str(e)}")
     
-    return {"files": sorted(files, key=lambda x: x["modified"], reverse=True)}
\ No newline at end of file
+    return {"files": [
+        {
+            "name": f["name"],
+            "size": f["size"],
+            "modified": datetime.fromtimestamp(f["mtime"]),
+            "path": f["path"]
+        }
+        for f in files
+    ]}
\ No newline at end of file
@@ -1,38 +1,96 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form, Header, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
+from pydantic import BaseModel
 from datetime import datetime
-import shutil
+import asyncio
+import hashlib
+import logging
 import os
+import re
 import uuid
-from typing import Optional
+import aiofiles
+import aiofiles.os
+from typing import List, Optional
 
 from app.models.meeting import Meeting
+from app.models.upload_blob import UploadBlob
 from app.models.user import User
-from app.models.database import get_db
+from app.models.database import get_db, AsyncSessionLocal
 from app.services.transcription import TranscriptionService
 from app.services.summarization import SummarizationService
+from app.services.semantic_cache import SemanticCache
+from app.services.progress import meeting_progress
+from app.services.jobs import job_runner
+from app.config import settings
 from app.services.oauth_service import current_active_user
+from app.utils.helpers import word_count
 
 router = APIRouter(prefix="/meetings", tags=["Meetings"])
 
+logger = logging.getLogger(__name__)
+
 # Configure upload folder   
 UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 # Initialize services
 transcription_service = TranscriptionService()
-summarization_service = SummarizationService()
+summarization_service = SummarizationService(
+    cache=SemanticCache(
+        threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+        max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES
+    ) if settings.SEMANTIC_CACHE_ENABLED else None
+)
+
+# Listing rows carry no transcript/summary text; fetch a single meeting for those
+class MeetingListItem(BaseModel):
+    id: uuid.UUID
+    title: str
+    platform: str
+    status: str
+    transcription_status: str
+    summary_status: str
+    duration_minutes: Optional[int] = None
+    word_count_transcription: Optional[int] = None
+    word_count_summary: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
 
 # 1. List User's Meetings
-@router.get("/")
+@router.get("/", response_model=List[MeetingListItem])
 async def list_meetings(
+    request: Request,
+    response: Response,
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all meetings for the current user"""
+    # Cheap version check first: count catches deletes, MAX(revision) catches inserts and edits
+    version = (await db.execute(
+        select(func.count(), func.max(Meeting.revision)).where(Meeting.user_id == user.id)
+    )).one()
+    etag = f'W/"{version[0]}-{version[1] or 0}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     result = await db.execute(
         select(Meeting)
+        .options(load_only(
+            Meeting.id, Meeting.title, Meeting.platform, Meeting.status,
+            Meeting.transcription_status, Meeting.summary_status, Meeting.duration_minutes,
+            Meeting.word_count_transcription, Meeting.word_count_summary,
+            Meeting.created_at, Meeting.updated_at
+        ))
         .filter(Meeting.user_id == user.id)
         .order_by(Meeting.created_at.desc())
     )
@@ -48,16 +106,25 @@ async def upload_meeting(
     db: AsyncSession = Depends(get_db)
 ):
     """Upload a meeting file for processing"""
+    # Reject oversized uploads before touching the disk when the size is known up front
+    if file.size is not None and file.size > settings.MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail="File too large")
+    
     try:
-        unique_id = str(uuid.uuid4())
+        unique_id = uuid.uuid4()
         file_path = os.path.join(UPLOAD_DIR, f"{unique_id}_{file.filename}")
         
         # Get title from form or use filename
         meeting_title = title if title and title.strip() else file.filename
 
-        # Save uploaded file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Stream the upload to disk in chunks without blocking the event loop
+        written = 0
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > settings.MAX_FILE_SIZE:
+                    raise HTTPException(status_code=413, detail="File too large")
+                await buffer.write(chunk)
 
         new_meeting = Meeting(
             id=unique_id,
@@ -65,9 +132,7 @@ async def upload_meeting(
             title=meeting_title,
             platform="manual_upload",
             status="uploaded",
-            audio_file_path=file_path,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            audio_file_path=file_path
         )
 
         db.add(new_meeting)
@@ -75,24 +140,282 @@ async def upload_meeting(
         await db.refresh(new_meeting)
         
         return {
-            "meeting_id": unique_id, 
+            "meeting_id": str(unique_id), 
             "message": "File uploaded successfully.",
             "title": meeting_title,
             "status": "uploaded"
         }
 
+    except HTTPException:
+        if await aiofiles.os.path.exists(file_path):
+            await aiofiles.os.remove(file_path)
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+# Resumable uploads - audio is stored once per SHA-256 and sent in Content-Range chunks
+BLOB_DIR = os.path.join(UPLOAD_DIR, "blobs")
+os.makedirs(BLOB_DIR, exist_ok=True)
+SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+def _sha256_file(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _check_sha256(sha256: str) -> str:
+    sha256 = sha256.lower()
+    if not SHA256_RE.match(sha256):
+        raise HTTPException(status_code=400, detail="Invalid SHA-256 digest")
+    return sha256
+
+def _user_blob_dir(user: User) -> str:
+    return os.path.join(BLOB_DIR, user.id.hex)
+
+async def _part_size(part_path: str) -> int:
+    try:
+        return (await aiofiles.os.stat(part_path)).st_size
+    except FileNotFoundError:
+        return 0
+
+async def _create_blob_meeting(db: AsyncSession, user: User, blob: UploadBlob, title: Optional[str], filename: str) -> dict:
+    meeting_id = uuid.uuid4()
+    meeting_title = title if title and title.strip() else filename
+    db.add(Meeting(
+        id=meeting_id,
+        user_id=user.id,
+        title=meeting_title,
+        platform="manual_upload",
+        status="uploaded",
+        audio_file_path=blob.file_path
+    ))
+    await db.commit()
+    return {
+        "meeting_id": str(meeting_id),
+        "message": "File uploaded successfully.",
+        "title": meeting_title,
+        "status": "uploaded"
+    }
+
+@router.head("/upload/{sha256}")
+async def check_upload(
+    sha256: str,
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """200 if this user already stored this audio, otherwise 404 with the resume offset in Upload-Offset"""
+    sha256 = _check_sha256(sha256)
+    blob = await db.get(UploadBlob, (user.id, sha256))
+    if blob is not None:
+        return Response(status_code=200, headers={"Upload-Offset": str(blob.size)})
+    offset = await _part_size(os.path.join(_user_blob_dir(user), f"{sha256}.part"))
+    return Response(status_code=404, headers={"Upload-Offset": str(offset)})
+
+@router.post("/upload/{sha256}/chunk")
+async def upload_chunk(
+    sha256: str,
+    request: Request,
+    filename: str,
+    title: Optional[str] = None,
+    content_range: Optional[str] = Header(None),
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Append one Content-Range chunk; the final chunk verifies the digest and creates the meeting"""
+    sha256 = _check_sha256(sha256)
+    
+    # Already stored by this user - skip the transfer and just attach a new meeting
+    blob = await db.get(UploadBlob, (user.id, sha256))
+    if blob is not None:
+        return await _create_blob_meeting(db, user, blob, title, filename)
+    
+    match = CONTENT_RANGE_RE.match(content_range or "")
+    if not match:
+        raise HTTPException(status_code=400, detail="Content-Range header required: bytes start-end/total")
+    start, end, total = (int(g) for g in match.groups())
+    if end < start or end >= total:
+        raise HTTPException(status_code=416, detail="Invalid Content-Range")
+    if total > settings.MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail="File too large")
+    
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in transcription_service.get_supported_formats():
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    
+    blob_dir = _user_blob_dir(user)
+    await aiofiles.os.makedirs(blob_dir, exist_ok=True)
+    part_path = os.path.join(blob_dir, f"{sha256}.part")
+    offset = await _part_size(part_path)
+    if start != offset:
+        # Client and server disagree on progress; tell it where to resume from
+        raise HTTPException(status_code=409, detail="Chunk does not start at the upload offset",
+                            headers={"Upload-Offset": str(offset)})
+    
+    expected = end - start + 1
+    written = 0
+    async with aiofiles.open(part_path, "ab") as buffer:
+        async for chunk in request.stream():
+            written += len(chunk)
+            if written > expected:
+                break
+            await buffer.write(chunk)
+    if written != expected:
+        # Drop whatever this request appended so the offset stays on a chunk boundary
+        await asyncio.to_thread(os.truncate, part_path, offset)
+        raise HTTPException(status_code=400, detail="Chunk length does not match Content-Range",
+                            headers={"Upload-Offset": str(offset)})
+    
+    if end + 1 < total:
+        return {"sha256": sha256, "offset": end + 1, "status": "partial"}
+    
+    # Final chunk - only a file matching its digest becomes a blob
+    if await asyncio.to_thread(_sha256_file, part_path) != sha256:
+        await aiofiles.os.remove(part_path)
+        raise HTTPException(status_code=422, detail="Uploaded data does not match SHA-256")
+    
+    file_path = os.path.join(blob_dir, f"{sha256}{ext}")
+    await aiofiles.os.replace(part_path, file_path)
+    
+    blob = UploadBlob(user_id=user.id, sha256=sha256, file_path=file_path, size=total)
+    db.add(blob)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent upload of the same audio finished first
+        await db.rollback()
+        blob = await db.get(UploadBlob, (user.id, sha256))
+    
+    return await _create_blob_meeting(db, user, blob, title, filename)
+
+# Background jobs - each opens its own session since the request's is gone by the time they run
+async def _load_meeting(db: AsyncSession, meeting_id: uuid.UUID) -> Optional[Meeting]:
+    result = await db.execute(select(Meeting).filter(Meeting.id == meeting_id))
+    return result.scalars().first()
+
+async def _transcribe_job(meeting_id: uuid.UUID):
+    async with AsyncSessionLocal() as db:
+        meeting = await _load_meeting(db, meeting_id)
+        if not meeting:
+            return
+        # End the read-only transaction so no pooled connection sits idle during the API call
+        await db.commit()
+        
+        try:
+            # Progress goes to event subscribers; the row is only written once at the end
+            meeting_progress.publish(meeting_id, "transcribing")
+            
+            transcription = await transcription_service.transcribe_file(meeting.audio_file_path)
+            
+            meeting.transcription_text = transcription
+            meeting.status = "transcribed"
+            meeting.transcription_status = "completed"
+            meeting.word_count_transcription = word_count(transcription)
+            await db.commit()
+            meeting_progress.finish(meeting_id, "transcribed")
+        
+        except Exception as e:
+            logger.error("Transcription failed for meeting %s: %s", meeting_id, e)
+            await db.rollback()
+            meeting.status = "failed"
+            meeting.transcription_status = "failed"
+            await db.commit()
+            meeting_progress.finish(meeting_id, "failed")
+
+async def _summarize_job(meeting_id: uuid.UUID, style: str):
+    async with AsyncSessionLocal() as db:
+        meeting = await _load_meeting(db, meeting_id)
+        if not meeting:
+            return
+        await db.commit()
+        
+        try:
+            meeting_progress.publish(meeting_id, "summarizing")
+            
+            summary = await summarization_service.summarize_text(
+                meeting.transcription_text, style, scope=str(meeting.user_id)
+            )
+            
+            meeting.summary_text = summary
+            meeting.status = "summarized"
+            meeting.summary_status = "completed"
+            meeting.word_count_summary = word_count(summary)
+            await db.commit()
+            meeting_progress.finish(meeting_id, "summarized")
+        
+        except Exception as e:
+            logger.error("Summarization failed for meeting %s: %s", meeting_id, e)
+            await db.rollback()
+            meeting.summary_status = "failed"
+            await db.commit()
+            meeting_progress.finish(meeting_id, "failed")
+
+async def _process_job(meeting_id: uuid.UUID, style: str):
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(Meeting.audio_file_path, Meeting.user_id).where(Meeting.id == meeting_id)
+        )).first()
+        if row is None:
+            return
+        audio_file_path, user_id = row
+        await db.commit()
+        
+        # Results are written with one Core UPDATE - no ORM instance to track or flush
+        values = {}
+        try:
+            meeting_progress.publish(meeting_id, "transcribing")
+            
+            # Transcribe - cached by audio hash, long files are split and transcribed concurrently
+            transcription = await transcription_service.transcribe_file(audio_file_path)
+            values.update(
+                transcription_text=transcription,
+                transcription_status="completed",
+                word_count_transcription=word_count(transcription)
+            )
+            
+            # Summarize
+            meeting_progress.publish(meeting_id, "summarizing")
+            summary = await summarization_service.summarize_text(transcription, style, scope=str(user_id))
+            values.update(
+                summary_text=summary,
+                summary_status="completed",
+                word_count_summary=word_count(summary),
+                status="summarized"
+            )
+            
+            await db.execute(update(Meeting).where(Meeting.id == meeting_id).values(**values))
+            await db.commit()
+            meeting_progress.finish(meeting_id, "summarized")
+        
+        except Exception as e:
+            logger.error("Processing failed for meeting %s: %s", meeting_id, e)
+            await db.rollback()
+            # Keep a finished transcript even when summarizing failed
+            values.setdefault("transcription_status", "failed")
+            values.update(status="failed", summary_status="failed")
+            await db.execute(update(Meeting).where(Meeting.id == meeting_id).values(**values))
+            await db.commit()
+            meeting_progress.finish(meeting_id, "failed")
+
+def _enqueue(meeting_id: uuid.UUID, job) -> dict:
+    if job_runner.is_running(meeting_id):
+        job.close()
+        raise HTTPException(status_code=409, detail="Meeting is already being processed")
+    meeting_progress.publish(meeting_id, "queued")
+    job_id = job_runner.submit(meeting_id, job)
+    return {"meeting_id": meeting_id, "job_id": job_id, "status": "queued"}
+
 # 3. Transcribe Meeting
-@router.post("/transcribe/{meeting_id}")
+@router.post("/transcribe/{meeting_id}", status_code=202)
 async def transcribe_meeting(
-    meeting_id: str,
+    meeting_id: uuid.UUID,
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Transcribe a meeting's audio file"""
+    """Queue transcription of a meeting's audio file; follow progress via /events or /status"""
     result = await db.execute(
         select(Meeting).filter(
             Meeting.id == meeting_id,
@@ -103,46 +426,20 @@ async def transcribe_meeting(
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    if not os.path.exists(meeting.audio_file_path):
+    if not await aiofiles.os.path.exists(meeting.audio_file_path):
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    try:
-        meeting.status = "transcribing"
-        meeting.transcription_status = "processing"
-        await db.commit()
-        
-        transcription = await transcription_service.transcribe_file(meeting.audio_file_path)
-        
-        meeting.transcription_text = transcription
-        meeting.status = "transcribed"
-        meeting.transcription_status = "completed"
-        meeting.word_count_transcription = len(transcription.split()) if transcription else 0
-        meeting.updated_at = datetime.utcnow()
-        await db.commit()
-        
-        return {
-            "meeting_id": meeting.id, 
-            "transcription": transcription,
-            "word_count": meeting.word_count_transcription,
-            "status": "transcribed"
-        }
-
-    except Exception as e:
-        await db.rollback()
-        meeting.status = "failed"
-        meeting.transcription_status = "failed"
-        await db.commit()
-        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    return _enqueue(meeting_id, _transcribe_job(meeting_id))
 
 # 4. Summarize Meeting
-@router.post("/summarize/{meeting_id}")
+@router.post("/summarize/{meeting_id}", status_code=202)
 async def summarize_meeting(
-    meeting_id: str,
+    meeting_id: uuid.UUID,
     style: str = "detailed",
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Generate a summary of the meeting transcription"""
+    """Queue a summary of the meeting transcription; follow progress via /events or /status"""
     result = await db.execute(
         select(Meeting).filter(
             Meeting.id == meeting_id,
@@ -156,42 +453,17 @@ async def summarize_meeting(
     if not meeting.transcription_text:
         raise HTTPException(status_code=400, detail="No transcription available. Please transcribe first.")
 
-    try:
-        meeting.summary_status = "processing"
-        await db.commit()
-        
-        summary = await summarization_service.summarize_text(meeting.transcription_text, style)
-        
-        meeting.summary_text = summary
-        meeting.status = "summarized"
-        meeting.summary_status = "completed"
-        meeting.word_count_summary = len(summary.split()) if summary else 0
-        meeting.updated_at = datetime.utcnow()
-        await db.commit()
-        
-        return {
-            "meeting_id": meeting.id, 
-            "summary": summary,
-            "style": style,
-            "word_count": meeting.word_count_summary,
-            "status": "summarized"
-        }
-
-    except Exception as e:
-        await db.rollback()
-        meeting.summary_status = "failed"
-        await db.commit()
-        raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
+    return _enqueue(meeting_id, _summarize_job(meeting_id, style))
 
 # 5. Process Meeting (Transcribe + Summarize)
-@router.post("/process/{meeting_id}")
+@router.post("/process/{meeting_id}", status_code=202)
 async def process_meeting(
-    meeting_id: str,
+    meeting_id: uuid.UUID,
     style: str = "detailed",
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Process a meeting: transcribe and then summarize"""
+    """Queue processing of a meeting: transcribe and then summarize"""
     result = await db.execute(
         select(Meeting).filter(
             Meeting.id == meeting_id,
@@ -202,59 +474,89 @@ async def process_meeting(
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    if not os.path.exists(meeting.audio_file_path):
+    if not await aiofiles.os.path.exists(meeting.audio_file_path):
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    try:
-        # Update status to processing
-        meeting.status = "transcribing"
-        meeting.transcription_status = "processing"
-        meeting.summary_status = "pending"
-        await db.commit()
-        
-        # Transcribe
-        transcription = await transcription_service.transcribe_file(meeting.audio_file_path)
-        meeting.transcription_text = transcription
-        meeting.transcription_status = "completed"
-        meeting.word_count_transcription = len(transcription.split()) if transcription else 0
-        
-        # Update status for summarization
-        meeting.status = "transcribed"
-        meeting.summary_status = "processing"
-        await db.commit()
-        
-        # Summarize
-        summary = await summarization_service.summarize_text(transcription, style)
-        meeting.summary_text = summary
-        meeting.summary_status = "completed"
-        meeting.word_count_summary = len(summary.split()) if summary else 0
-        
-        # Final status update
-        meeting.status = "summarized"
-        meeting.updated_at = datetime.utcnow()
-        await db.commit()
+    return _enqueue(meeting_id, _process_job(meeting_id, style))
 
-        return {
-            "meeting_id": meeting.id,
-            "transcription": transcription,
-            "summary": summary,
-            "word_count_transcription": meeting.word_count_transcription,
-            "word_count_summary": meeting.word_count_summary,
-            "status": "summarized"
-        }
+# Current processing state
+@router.get("/{meeting_id}/status")
+async def meeting_status(
+    meeting_id: uuid.UUID,
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the stored status of a meeting plus the live phase of any running job"""
+    result = await db.execute(
+        select(Meeting.status, Meeting.transcription_status, Meeting.summary_status).filter(
+            Meeting.id == meeting_id,
+            Meeting.user_id == user.id
+        )
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    return {
+        "meeting_id": meeting_id,
+        "status": row.status,
+        "transcription_status": row.transcription_status,
+        "summary_status": row.summary_status,
+        "phase": meeting_progress.last_phase(meeting_id),
+        "job_id": job_runner.job_id(meeting_id)
+    }
 
-    except Exception as e:
-        await db.rollback()
-        meeting.status = "failed"
-        meeting.transcription_status = "failed" if not meeting.transcription_text else meeting.transcription_status
-        meeting.summary_status = "failed"
-        await db.commit()
-        raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+# Live processing phases as server-sent events
+TERMINAL_PHASES = frozenset({"transcribed", "summarized", "failed"})
+
+@router.get("/{meeting_id}/events")
+async def meeting_events(
+    meeting_id: uuid.UUID,
+    request: Request,
+    user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream processing phases (transcribing, summarizing, ...) for a meeting"""
+    result = await db.execute(
+        select(Meeting.status).filter(
+            Meeting.id == meeting_id,
+            Meeting.user_id == user.id
+        )
+    )
+    status = result.scalar_one_or_none()
+    if status is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    await db.commit()
+
+    async def event_stream():
+        queue = meeting_progress.subscribe(meeting_id)
+        try:
+            phase = meeting_progress.last_phase(meeting_id) or status
+            # Nothing running means nothing more will be published - report the latest state and close
+            if phase in TERMINAL_PHASES or not job_runner.is_running(meeting_id):
+                while not queue.empty():
+                    phase = queue.get_nowait()
+                yield f"data: {phase}\n\n"
+                return
+            yield f"data: {phase}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    phase = await asyncio.wait_for(queue.get(), timeout=settings.WS_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {phase}\n\n"
+                if phase in TERMINAL_PHASES:
+                    break
+        finally:
+            meeting_progress.unsubscribe(meeting_id, queue)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 # 6. Get Meeting Details
 @router.get("/{meeting_id}")
 async def get_meeting(
-    meeting_id: str,
+    meeting_id: uuid.UUID,
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -273,7 +575,7 @@ async def get_meeting(
 # 7. Delete Meeting
 @router.delete("/{meeting_id}")
 async def delete_meeting(
-    meeting_id: str,
+    meeting_id: uuid.UUID,
     user: User = Depends(current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -289,14 +591,30 @@ async def delete_meeting(
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     try:
-        # Delete associated file if it exists
-        if meeting.audio_file_path and os.path.exists(meeting.audio_file_path):
-            os.unlink(meeting.audio_file_path)
+        audio_file_path = meeting.audio_file_path
         
         # Delete from database
         await db.delete(meeting)
+        await db.flush()
+        
+        # Shared blobs stay on disk until the last meeting using them is gone
+        if audio_file_path and audio_file_path.startswith(BLOB_DIR):
+            remaining = await db.scalar(
+                select(func.count()).select_from(Meeting).where(Meeting.audio_file_path == audio_file_path)
+            )
+            if remaining:
+                audio_file_path = None
+            else:
+                await db.execute(delete(UploadBlob).where(
+                    UploadBlob.user_id == user.id,
+                    UploadBlob.file_path == audio_file_path
+                ))
         await db.commit()
         
+        # Delete associated file if it exists
+        if audio_file_path and await aiofiles.os.path.exists(audio_file_path):
+            await aiofiles.os.remove(audio_file_path)
+        
         return {"message": "Meeting deleted successfully", "meeting_id": meeting_id}
     
     except Exception as e:
@@ -317,7 +635,7 @@ async def upload_from_path(
     if not file_path.startswith(user.zoom_recordings_path):
         raise HTTPException(403, "File not in authorized directory")
     
-    if not os.path.exists(file_path):
+    if not await aiofiles.os.path.exists(file_path):
         raise HTTPException(404, "File not found")
     
     # Continue with existing upload logic...
@@ -329,20 +647,25 @@ async def get_meeting_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """Get statistics about user's meetings"""
+    # Aggregate in the database - one row back instead of every meeting.
+    # "!= ''" is NULL for NULL columns, so it matches the old truthiness check
     result = await db.execute(
-        select(Meeting).filter(Meeting.user_id == user.id)
+        select(
+            func.count().label("total"),
+            func.count().filter(Meeting.transcription_text != "").label("transcribed"),
+            func.count().filter(Meeting.summary_text != "").label("summarized"),
+            func.coalesce(func.sum(Meeting.duration_minutes), 0).label("total_duration")
+        ).where(Meeting.user_id == user.id)
     )
-    meetings = result.scalars().all()
+    stats = result.one()
     
-    total_meetings = len(meetings)
-    transcribed_meetings = len([m for m in meetings if m.transcription_text])
-    summarized_meetings = len([m for m in meetings if m.summary_text])
-    total_duration = sum([m.duration_minutes or 0 for m in meetings])
+    total_meetings = stats.total
+    total_duration = stats.total_duration
     
     return {
         "total_meetings": total_meetings,
-        "transcribed_meetings": transcribed_meetings,
-        "summarized_meetings": summarized_meetings,
+        "transcribed_meetings": stats.transcribed,
+        "summarized_meetings": stats.summarized,
         "total_duration_minutes": total_duration,
         "avg_duration_minutes": total_duration / total_meetings if total_meetings > 0 else 0
     }
\ No newline at end of file
@@ -2,7 +2,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-import os
+import aiofiles.os
 
 from app.models.user import User
 from app.models.database import get_db
@@ -25,10 +25,10 @@ async def set_recording_path(
         raise HTTPException(status_code=400, detail="Path cannot be empty")
     
     # Check if path exists
-    if not os.path.exists(path):
+    if not await aiofiles.os.path.exists(path):
         raise HTTPException(status_code=404, detail="Path does not exist")
     
-    if not os.path.isdir(path):
+    if not await aiofiles.os.path.isdir(path):
         raise HTTPException(status_code=400, detail="Path must be a directory")
     
     user.zoom_recordings_path = path.strip()
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+import uuid
+from typing import Coroutine, Dict
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+class JobRunner:
+    """Runs long meeting jobs as background tasks of this worker, one job per meeting at a time"""
+
+    def __init__(self, max_concurrent: int = 4):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._job_ids: Dict[str, str] = {}
+
+    def is_running(self, meeting_id) -> bool:
+        return str(meeting_id) in self._tasks
+
+    def job_id(self, meeting_id):
+        return self._job_ids.get(str(meeting_id))
+
+    def submit(self, meeting_id, job: Coroutine) -> str:
+        """Schedule job for meeting_id and return its job id"""
+        key = str(meeting_id)
+        job_id = uuid.uuid4().hex
+        task = asyncio.create_task(self._run(job_id, job))
+        self._tasks[key] = task
+        self._job_ids[key] = job_id
+
+        def _done(_):
+            self._tasks.pop(key, None)
+            self._job_ids.pop(key, None)
+
+        task.add_done_callback(_done)
+        return job_id
+
+    async def _run(self, job_id: str, job: Coroutine):
+        async with self._semaphore:
+            try:
+                await job
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Jobs record their own failure state; this only catches the unexpected
+                logger.exception("Background job %s crashed", job_id)
+
+    async def shutdown(self):
+        """Cancel outstanding jobs and wait for them to unwind"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+job_runner = JobRunner(settings.MAX_CONCURRENT_JOBS)
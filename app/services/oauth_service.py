@@ -1,7 +1,11 @@
 import secrets
-from fastapi_users import FastAPIUsers
+import time
+from collections import OrderedDict
+import jwt
+from fastapi_users import FastAPIUsers, exceptions
 from fastapi_users.authentication import AuthenticationBackend, BearerTransport, JWTStrategy  # Changed import
 from fastapi_users.db import SQLAlchemyUserDatabase
+from fastapi_users.jwt import decode_jwt
 from fastapi_users.manager import BaseUserManager, UUIDIDMixin
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, Request
@@ -45,9 +49,47 @@ async def get_user_manager(user_db: UserDatabase = Depends(get_user_db)):
 # Authentication configuration - CHANGED TO BEARER TRANSPORT
 bearer_transport = BearerTransport(tokenUrl="/api/auth/jwt/login") # Changed from CookieTransport
 
+# Decoded tokens are remembered briefly so each request skips the HMAC check + JSON parse
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+class CachedJWTStrategy(JWTStrategy):
+    """JWTStrategy that caches token -> user id for TOKEN_CACHE_TTL seconds"""
+
+    async def read_token(self, token, user_manager):
+        if token is None:
+            return None
+        
+        now = time.time()
+        cached = _token_cache.get(token)
+        if cached is not None and cached[0] > now:
+            user_id = cached[1]
+        else:
+            try:
+                data = decode_jwt(token, self.decode_key, self.token_audience, algorithms=[self.algorithm])
+                user_id = data.get("sub")
+                if user_id is None:
+                    return None
+            except jwt.PyJWTError:
+                _token_cache.pop(token, None)
+                return None
+            # Never cache past the token's own expiry
+            expires_at = min(now + TOKEN_CACHE_TTL, data.get("exp", now + TOKEN_CACHE_TTL))
+            _token_cache[token] = (expires_at, user_id)
+            _token_cache.move_to_end(token)
+            while len(_token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+                _token_cache.popitem(last=False)
+        
+        try:
+            parsed_id = user_manager.parse_id(user_id)
+            return await user_manager.get(parsed_id)
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
 # JWT Strategy
 def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(
+    return CachedJWTStrategy(
         secret=SECRET_KEY,
         lifetime_seconds=3600 * 24 * 7,  # 7 days
     )
@@ -65,7 +107,8 @@ fastapi_users = FastAPIUsers[User, uuid.UUID](
     [auth_backend],
 )
 
-# Auth dependencies
+# Auth dependencies - FastAPI resolves each once per request, and get_user_db shares
+# the route's get_db session, so the user lookup rides on the request's session
 current_active_user = fastapi_users.current_user(active=True)
 current_user = fastapi_users.current_user()
 optional_current_user = fastapi_users.current_user(optional=True)
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Dict, Optional, Set
+
+class MeetingProgress:
+    """In-process broadcaster for meeting processing phases (per worker, not persisted)"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._last_phase: Dict[str, str] = {}
+
+    def publish(self, meeting_id, phase: str):
+        """Send phase to every listener of the meeting and remember it for late subscribers"""
+        key = str(meeting_id)
+        self._last_phase[key] = phase
+        for queue in self._subscribers.get(key, ()):
+            queue.put_nowait(phase)
+
+    def finish(self, meeting_id, phase: str):
+        """Publish a terminal phase and forget the meeting"""
+        self.publish(meeting_id, phase)
+        self._last_phase.pop(str(meeting_id), None)
+
+    def last_phase(self, meeting_id) -> Optional[str]:
+        return self._last_phase.get(str(meeting_id))
+
+    def subscribe(self, meeting_id) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(str(meeting_id), set()).add(queue)
+        return queue
+
+    def unsubscribe(self, meeting_id, queue: asyncio.Queue):
+        key = str(meeting_id)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[key]
+
+meeting_progress = MeetingProgress()
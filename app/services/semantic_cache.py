@@ -0,0 +1,93 @@
+import hashlib
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+class SemanticCache:
+    """In-process cache of LLM responses looked up by embedding similarity"""
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1000, exact_ttl: int = 7 * 24 * 3600):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.exact_ttl = exact_ttl
+        # namespace -> OrderedDict[entry_id, (unit vector, response)] in LRU order
+        self._entries: Dict[str, "OrderedDict[int, Tuple[List[float], Any]]"] = {}
+        # (namespace, entry_id) across all namespaces in LRU order, so max_entries bounds the total
+        self._order: "OrderedDict[Tuple[str, int], None]" = OrderedDict()
+        self._next_id = 0
+        # "namespace:hash" -> (expires_at, response) in LRU order, checked before any embedding
+        self._exact: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _exact_key(namespace: str, key_text: str) -> str:
+        digest = hashlib.blake2b(key_text.encode(), digest_size=16).hexdigest()
+        return f"{namespace}:{digest}"
+
+    def get_exact(self, namespace: str, key_text: str) -> Optional[Any]:
+        """Return the response cached for exactly this input, skipping the embedding call"""
+        key = self._exact_key(namespace, key_text)
+        cached = self._exact.get(key)
+        if cached is None:
+            return None
+        expires_at, response = cached
+        if expires_at < time.monotonic():
+            self._exact.pop(key, None)
+            return None
+        self._exact.move_to_end(key)
+        return response
+
+    def set_exact(self, namespace: str, key_text: str, response: Any):
+        key = self._exact_key(namespace, key_text)
+        self._exact[key] = (time.monotonic() + self.exact_ttl, response)
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        norm = math.sqrt(sum(v * v for v in vector))
+        if not norm:
+            return list(vector)
+        return [v / norm for v in vector]
+
+    def lookup(self, namespace: str, vector: List[float]) -> Optional[Any]:
+        """Return the cached response most similar to vector if it clears the threshold"""
+        entries = self._entries.get(namespace)
+        if not entries or not vector:
+            return None
+
+        query = self._normalize(vector)
+        best_id, best_score = None, self.threshold
+        # Vectors are unit length, so the dot product is the cosine similarity
+        for entry_id, (cached_vector, _) in entries.items():
+            score = sum(map(operator.mul, query, cached_vector))
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+
+        if best_id is None:
+            return None
+        entries.move_to_end(best_id)
+        self._order.move_to_end((namespace, best_id))
+        return entries[best_id][1]
+
+    def store(self, namespace: str, vector: List[float], response: Any):
+        """Cache response under vector, evicting the least recently used entry when full"""
+        if not vector:
+            return
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        entries[self._next_id] = (self._normalize(vector), response)
+        self._order[(namespace, self._next_id)] = None
+        self._next_id += 1
+        while len(self._order) > self.max_entries:
+            (old_namespace, old_id), _ = self._order.popitem(last=False)
+            old_entries = self._entries[old_namespace]
+            del old_entries[old_id]
+            if not old_entries:
+                del self._entries[old_namespace]
+
+    def clear(self):
+        self._entries.clear()
+        self._order.clear()
+        self._exact.clear()
@@ -2,78 +2,168 @@ import os
 import json
 from google import genai
 from google.genai import types
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from app.config import settings
+from app.services.semantic_cache import SemanticCache
+
+# Static instructions are sent as system_instruction so the prompt prefix is identical
+# across calls and only the meeting content varies
+STYLE_PROMPTS = {
+    "brief": "Create a brief 2-3 sentence summary of the key points.",
+    "detailed": "Provide a detailed summary with main topics, key insights, and action items.",
+    "bullet_points": "Create a bullet-point summary with main topics and subtopics.",
+    "executive": "Create an executive summary suitable for business stakeholders."
+}
+
+SUMMARY_INSTRUCTION = "You are an expert at summarizing meeting transcripts and documents."
+
+STRUCTURED_INSTRUCTION = """Extract structured information from this meeting transcript and respond with valid JSON in this exact format:
+{
+    "main_topics": ["topic1", "topic2"],
+    "key_insights": ["insight1", "insight2"],
+    "action_items": ["action1", "action2"],
+    "participants": ["person1", "person2"],
+    "summary": "brief summary",
+    "sentiment": "positive/neutral/negative",
+    "duration_estimate": "X minutes"
+}"""
+
+QUESTION_INSTRUCTION = "You are a helpful assistant specialized in answering questions about meetings and documents."
+
+ACTION_ITEMS_INSTRUCTION = """Extract action items from this meeting transcript. Return as JSON in this format:
+{"action_items": ["item1", "item2", "item3"]}"""
+
+SENTIMENT_INSTRUCTION = """Analyze the sentiment of this meeting content. Respond with JSON in this format:
+{
+    "sentiment": "positive/neutral/negative",
+    "score": 3,
+    "confidence": 0.8,
+    "emotions": ["professional", "collaborative"]
+}"""
+
+MINUTES_INSTRUCTION = "Generate formal meeting minutes from this transcript. Include attendees, agenda items, decisions, and action items."
+
+# Variable content always goes last between fixed delimiters, so everything before it
+# is a byte-identical prefix the provider can reuse across meetings
+TRANSCRIPT_BEGIN = "---BEGIN TRANSCRIPT---\n"
+TRANSCRIPT_END = "\n---END TRANSCRIPT---"
+SUMMARY_PREFIX = "Please summarize this content:\n\n" + TRANSCRIPT_BEGIN
+TRANSCRIPT_PREFIX = "Transcript:\n" + TRANSCRIPT_BEGIN
+CONTENT_PREFIX = "Content:\n" + TRANSCRIPT_BEGIN
+
+# Characters of cache key sent for embedding; longer keys only use the exact-match tier
+EMBED_WINDOW = 2000
 
 class SummarizationService:
     """Service for AI-powered summarization using Google Gemini"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[SemanticCache] = None):
         self.client = None
+        self.cache = cache
         self.model = settings.GEMINI_MODEL
+        self.embedding_model = settings.GEMINI_EMBEDDING_MODEL
+        
+        # Request configs are built once and reused for every call
+        self._summary_configs = {
+            style: types.GenerateContentConfig(system_instruction=f"{SUMMARY_INSTRUCTION} {prompt}")
+            for style, prompt in STYLE_PROMPTS.items()
+        }
+        self._structured_config = types.GenerateContentConfig(
+            system_instruction=STRUCTURED_INSTRUCTION,
+            response_mime_type="application/json"
+        )
+        self._question_config = types.GenerateContentConfig(system_instruction=QUESTION_INSTRUCTION)
+        self._action_items_config = types.GenerateContentConfig(
+            system_instruction=ACTION_ITEMS_INSTRUCTION,
+            response_mime_type="application/json"
+        )
+        self._sentiment_config = types.GenerateContentConfig(
+            system_instruction=SENTIMENT_INSTRUCTION,
+            response_mime_type="application/json"
+        )
+        self._minutes_config = types.GenerateContentConfig(system_instruction=MINUTES_INSTRUCTION)
         if settings.GEMINI_API_KEY:
             try:
                 self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
             except Exception:
                 self.client = None
     
-    async def summarize_text(self, text: str, style: str = "detailed") -> str:
+    async def _cache_lookup(self, namespace: str, key_text: str, scope: Optional[str]) -> Tuple[Optional[Any], Optional[List[float]]]:
+        """Check the exact-match tier, then embed key_text for a semantic lookup; cache failures never fail the call"""
+        # Entries are private to a scope (the owning user) - unscoped calls are never cached
+        if self.cache is None or scope is None:
+            return None, None
+        namespace = f"{scope}:{namespace}"
+        cached = self.cache.get_exact(namespace, key_text)
+        if cached is not None:
+            return cached, None
+        # Only inputs that fit in the embedded window can be told apart by their embedding
+        if len(key_text) > EMBED_WINDOW:
+            return None, None
+        try:
+            response = await self.client.aio.models.embed_content(
+                model=self.embedding_model,
+                contents=key_text
+            )
+            embedding = response.embeddings[0].values
+        except Exception:
+            return None, None
+        return self.cache.lookup(namespace, embedding), embedding
+    
+    def _cache_store(self, namespace: str, key_text: str, scope: Optional[str], embedding: Optional[List[float]], result: Any):
+        if self.cache is None or scope is None:
+            return
+        namespace = f"{scope}:{namespace}"
+        self.cache.set_exact(namespace, key_text, result)
+        if embedding:
+            self.cache.store(namespace, embedding, result)
+    
+    async def summarize_text(self, text: str, style: str = "detailed", scope: Optional[str] = None) -> str:
         """Summarize text using Google Gemini"""
         if not self.client:
             raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
             
         try:
-            style_prompts = {
-                "brief": "Create a brief 2-3 sentence summary of the key points.",
-                "detailed": "Provide a detailed summary with main topics, key insights, and action items.",
-                "bullet_points": "Create a bullet-point summary with main topics and subtopics.",
-                "executive": "Create an executive summary suitable for business stakeholders."
-            }
+            config = self._summary_configs.get(style, self._summary_configs["detailed"])
             
-            prompt = style_prompts.get(style, style_prompts["detailed"])
-            full_prompt = f"You are an expert at summarizing meeting transcripts and documents. {prompt}\n\nPlease summarize this content:\n\n{text}"
+            cache_key = f"{style}||{text}"
+            cached, embedding = await self._cache_lookup("summarize", cache_key, scope)
+            if cached is not None:
+                return cached
             
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=full_prompt
+                contents=[SUMMARY_PREFIX, text, TRANSCRIPT_END],
+                config=config
             )
             
-            return response.text or "Unable to generate summary"
+            if not response.text:
+                return "Unable to generate summary"
+            self._cache_store("summarize", cache_key, scope, embedding, response.text)
+            return response.text
             
         except Exception as e:
             raise Exception(f"Summarization failed: {str(e)}")
     
-    async def structured_analysis(self, text: str) -> Dict[str, Any]:
+    async def structured_analysis(self, text: str, scope: Optional[str] = None) -> Dict[str, Any]:
         """Get structured analysis of meeting content"""
         if not self.client:
             raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
             
         try:
-            prompt = f"""Extract structured information from this meeting transcript and respond with valid JSON in this exact format:
-{{
-    "main_topics": ["topic1", "topic2"],
-    "key_insights": ["insight1", "insight2"],
-    "action_items": ["action1", "action2"],
-    "participants": ["person1", "person2"],
-    "summary": "brief summary",
-    "sentiment": "positive/neutral/negative",
-    "duration_estimate": "X minutes"
-}}
-
-Transcript:
-{text}"""
+            cached, embedding = await self._cache_lookup("structured", text, scope)
+            if cached is not None:
+                return cached
             
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
+                contents=[TRANSCRIPT_PREFIX, text, TRANSCRIPT_END],
+                config=self._structured_config
             )
             
             result = json.loads(response.text or "{}")
-            return {
+            analysis = {
                 "main_topics": result.get("main_topics", []),
                 "key_insights": result.get("key_insights", []),
                 "action_items": result.get("action_items", []),
@@ -82,91 +172,92 @@ Transcript:
                 "sentiment": result.get("sentiment", "neutral"),
                 "duration_estimate": result.get("duration_estimate", "unknown")
             }
+            self._cache_store("structured", text, scope, embedding, analysis)
+            return analysis
             
         except Exception as e:
             raise Exception(f"Structured analysis failed: {str(e)}")
     
-    async def answer_question(self, question: str, context: str = "") -> str:
+    async def answer_question(self, question: str, context: str = "", scope: Optional[str] = None) -> str:
         """Answer questions about meeting content"""
         if not self.client:
             raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
             
         try:
-            prompt = "You are a helpful assistant specialized in answering questions about meetings and documents."
+            cache_key = f"{question}||{context}"
+            cached, embedding = await self._cache_lookup("answer", cache_key, scope)
+            if cached is not None:
+                return cached
             
+            # Context is shared by every question about a meeting, so it precedes the question
+            contents = []
             if context:
-                prompt += f" Use this context to answer questions: {context}"
-            
-            prompt += f"\n\nQuestion: {question}"
+                contents += ["Use this context to answer questions:\n" + TRANSCRIPT_BEGIN, context, TRANSCRIPT_END + "\n\n"]
+            contents.append(f"Question: {question}")
             
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt
+                contents=contents,
+                config=self._question_config
             )
             
-            return response.text or "Unable to answer question"
+            if not response.text:
+                return "Unable to answer question"
+            self._cache_store("answer", cache_key, scope, embedding, response.text)
+            return response.text
             
         except Exception as e:
             raise Exception(f"Question answering failed: {str(e)}")
     
-    async def generate_action_items(self, text: str) -> list:
+    async def generate_action_items(self, text: str, scope: Optional[str] = None) -> list:
         """Extract action items from meeting content"""
         if not self.client:
             raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
             
         try:
-            prompt = f"""Extract action items from this meeting transcript. Return as JSON in this format:
-{{"action_items": ["item1", "item2", "item3"]}}
-
-Content:
-{text}"""
+            cached, embedding = await self._cache_lookup("action_items", text, scope)
+            if cached is not None:
+                return cached
             
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
+                contents=[CONTENT_PREFIX, text, TRANSCRIPT_END],
+                config=self._action_items_config
             )
             
             result = json.loads(response.text or '{"action_items": []}')
-            return result.get("action_items", [])
+            action_items = result.get("action_items", [])
+            self._cache_store("action_items", text, scope, embedding, action_items)
+            return action_items
             
         except Exception as e:
             raise Exception(f"Action item extraction failed: {str(e)}")
     
-    async def sentiment_analysis(self, text: str) -> Dict[str, Any]:
+    async def sentiment_analysis(self, text: str, scope: Optional[str] = None) -> Dict[str, Any]:
         """Analyze sentiment of meeting content"""
         if not self.client:
             raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
             
         try:
-            prompt = f"""Analyze the sentiment of this meeting content. Respond with JSON in this format:
-{{
-    "sentiment": "positive/neutral/negative",
-    "score": 3,
-    "confidence": 0.8,
-    "emotions": ["professional", "collaborative"]
-}}
-
-Content:
-{text}"""
+            cached, embedding = await self._cache_lookup("sentiment", text, scope)
+            if cached is not None:
+                return cached
             
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
+                contents=[CONTENT_PREFIX, text, TRANSCRIPT_END],
+                config=self._sentiment_config
             )
             
             result = json.loads(response.text or '{"sentiment": "neutral", "score": 3, "confidence": 0.5, "emotions": []}')
-            return {
+            sentiment = {
                 "sentiment": result.get("sentiment", "neutral"),
                 "score": max(1, min(5, result.get("score", 3))),
                 "confidence": max(0, min(1, result.get("confidence", 0.5))),
                 "emotions": result.get("emotions", [])
             }
+            self._cache_store("sentiment", text, scope, embedding, sentiment)
+            return sentiment
             
         except Exception as e:
             raise Exception(f"Sentiment analysis failed: {str(e)}")
@@ -177,14 +268,10 @@ Content:
             raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
             
         try:
-            prompt = f"""Generate formal meeting minutes from this transcript. Include attendees, agenda items, decisions, and action items.
-
-Transcript:
-{text}"""
-            
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt
+                contents=[TRANSCRIPT_PREFIX, text, TRANSCRIPT_END],
+                config=self._minutes_config
             )
             
             return response.text or "Unable to generate meeting minutes"
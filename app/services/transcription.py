@@ -1,64 +1,211 @@
 import os
+import asyncio
+import hashlib
+import logging
+import shutil
+import tempfile
 import aiofiles
+import aiofiles.os
+import httpx
 from openai import AsyncOpenAI
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.config import settings
+from app.models.database import AsyncSessionLocal
+from app.models.transcript_cache import TranscriptCache
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_SIZE = 25 * 1024 * 1024  # Groq's per-request limit
+CHUNKED_THRESHOLD = 20 * 1024 * 1024  # Split above this to stay clear of the limit
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def _hash_audio(file_path: Path, model: str) -> str:
+    """blake2b of the model name and file bytes, read in 1MB chunks"""
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(model.encode())
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 class TranscriptionService:
     """Service for audio/video transcription using Groq's Whisper API"""
     
     def __init__(self):
+        # Long-lived pooled HTTP/2 client so Whisper calls reuse TLS connections
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(300.0, connect=10.0)
+        )
         self.client = AsyncOpenAI(
             api_key=settings.GROQ_API_KEY,
-            base_url="https://api.groq.com/openai/v1"
+            base_url="https://api.groq.com/openai/v1",
+            # Opt in to provider-side response caching on every request
+            default_headers={"x-use-cache": "true"},
+            http_client=self.http_client
         )
         self.model = settings.WHISPER_MODEL
     
+    async def close(self):
+        """Close the pooled HTTP connections"""
+        await self.client.close()
+    
+    async def _read_audio(self, file_path: Path) -> tuple:
+        """Read the file without blocking the event loop, as an upload tuple for the client"""
+        async with aiofiles.open(file_path, "rb") as f:
+            data = await f.read()
+        return (file_path.name, data)
+    
+    async def _transcribe_single(self, file_path: Path) -> str:
+        """Send one file to Whisper in a single request"""
+        # Check file size (Groq has limits)
+        file_size = (await aiofiles.os.stat(file_path)).st_size
+        if file_size > MAX_UPLOAD_SIZE:
+            raise ValueError(f"File too large: {file_size / 1024 / 1024:.1f}MB. Maximum: 25MB")
+        
+        # Read and transcribe file
+        audio_file = await self._read_audio(file_path)
+        return await self.client.audio.transcriptions.create(
+            model=self.model,
+            file=audio_file,
+            prompt="This is a meeting, interview, or podcast transcription. Include speakers and context.",
+            response_format="text",
+            temperature=0.0
+        )
+    
+    async def _get_cached_transcript(self, content_hash: str) -> Optional[str]:
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(TranscriptCache.transcription_text)
+                    .where(TranscriptCache.content_hash == content_hash)
+                )
+                return result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning("Transcript cache lookup failed: %s", e)
+            return None
+    
+    async def _store_cached_transcript(self, content_hash: str, transcription: str):
+        try:
+            async with AsyncSessionLocal() as session:
+                session.add(TranscriptCache(
+                    content_hash=content_hash,
+                    model=self.model,
+                    transcription_text=transcription
+                ))
+                try:
+                    await session.commit()
+                except IntegrityError:
+                    # Another request cached the same audio first
+                    await session.rollback()
+        except Exception as e:
+            logger.warning("Transcript cache store failed: %s", e)
+    
     async def transcribe_file(self, file_path: str) -> str:
-        """Transcribe audio/video file to text"""
+        """Transcribe audio/video file to text, splitting files too large for one request"""
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
+            if not await aiofiles.os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            # Check file size (Groq has limits)
-            file_size = file_path.stat().st_size
-            max_size = 25 * 1024 * 1024  # 25MB limit for Groq
+            # Identical audio (re-uploads, retried /process) reuses the stored transcript
+            content_hash = await asyncio.to_thread(_hash_audio, file_path, self.model)
+            cached = await self._get_cached_transcript(content_hash)
+            if cached is not None:
+                return cached
             
-            if file_size > max_size:
-                raise ValueError(f"File too large: {file_size / 1024 / 1024:.1f}MB. Maximum: 25MB")
-            
-            # Open and transcribe file
-            with open(file_path, "rb") as audio_file:
-                transcription = await self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    prompt="This is a meeting, interview, or podcast transcription. Include speakers and context.",
-                    response_format="text",
-                    temperature=0.0
-                )
+            file_size = (await aiofiles.os.stat(file_path)).st_size
+            if file_size > CHUNKED_THRESHOLD:
+                transcription = await self.transcribe_file_chunked(str(file_path))
+            else:
+                transcription = await self._transcribe_single(file_path)
             
+            if transcription:
+                await self._store_cached_transcript(content_hash, transcription)
             return transcription
             
         except Exception as e:
             raise Exception(f"Transcription failed: {str(e)}")
     
+    async def _split_audio(self, file_path: Path, output_dir: Path) -> List[Path]:
+        """Split audio into fixed-length mono MP3 segments with ffmpeg"""
+        segment_pattern = output_dir / "chunk_%04d.mp3"
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-i", str(file_path),
+                "-vn", "-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "64k",
+                "-f", "segment", "-segment_time", str(settings.TRANSCRIPTION_CHUNK_SECONDS),
+                str(segment_pattern),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise Exception("ffmpeg is required to split audio for chunked transcription")
+        
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise Exception(f"ffmpeg failed to split audio: {stderr.decode(errors='ignore').strip()}")
+        
+        return sorted(output_dir.glob("chunk_*.mp3"))
+    
+    async def transcribe_file_chunked(self, file_path: str, max_concurrent: Optional[int] = None) -> str:
+        """Transcribe a long file by splitting it and transcribing the pieces concurrently"""
+        try:
+            file_path = Path(file_path)
+            
+            if not await aiofiles.os.path.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            
+            # Without ffmpeg we can't split, so fall back to a single request
+            if shutil.which("ffmpeg") is None:
+                return await self._transcribe_single(file_path)
+            
+            output_dir = Path(tempfile.mkdtemp(prefix="transcribe_"))
+            try:
+                chunks = await self._split_audio(file_path, output_dir)
+                if not chunks:
+                    raise ValueError("No audio found to transcribe")
+                
+                semaphore = asyncio.Semaphore(max_concurrent or settings.WHISPER_CONCURRENCY)
+                
+                async def _transcribe_one(chunk: Path) -> str:
+                    async with semaphore:
+                        return await self._transcribe_single(chunk)
+                
+                # gather keeps chunk order; a transcript with holes is worse than an error
+                parts = await asyncio.gather(*[_transcribe_one(c) for c in chunks], return_exceptions=True)
+                errors = [p for p in parts if isinstance(p, BaseException)]
+                if errors:
+                    raise errors[0]
+                
+                return " ".join(part.strip() for part in parts if part)
+            finally:
+                shutil.rmtree(output_dir, ignore_errors=True)
+            
+        except Exception as e:
+            raise Exception(f"Chunked transcription failed: {str(e)}")
+    
     async def transcribe_with_timestamps(self, file_path: str) -> dict:
         """Transcribe with timestamp information"""
         try:
             file_path = Path(file_path)
             
-            with open(file_path, "rb") as audio_file:
-                transcription = await self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    response_format="verbose_json",
-                    timestamp_granularities=["word"],
-                    temperature=0.0
-                )
+            audio_file = await self._read_audio(file_path)
+            transcription = await self.client.audio.transcriptions.create(
+                model=self.model,
+                file=audio_file,
+                response_format="verbose_json",
+                timestamp_granularities=["word"],
+                temperature=0.0
+            )
             
             return {
                 "text": transcription.text,
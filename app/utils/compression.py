@@ -0,0 +1,11 @@
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip that leaves server-sent event streams alone - gzip would hold events back until the stream ends"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"].endswith("/events"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
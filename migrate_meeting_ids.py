@@ -0,0 +1,112 @@
+# migrate_meeting_ids.py
+# One-off upgrade for databases created before meetings.id became a Uuid column
+# and meetings.revision was added. Reads DATABASE_URL the same way the app does.
+#
+#   SQLite:     ids are stored as 32-char hex, so the dashes are stripped from
+#               meetings.id; the child tables are rebuilt so meeting_id matches
+#               and the ON DELETE CASCADE foreign keys exist
+#   PostgreSQL: child foreign keys are dropped, id/meeting_id are cast with
+#               USING ...::uuid and the foreign keys are re-added with ON DELETE CASCADE
+#
+# Both add meetings.revision (BIGINT NOT NULL DEFAULT 0) when it is missing.
+# Safe to run more than once.
+import asyncio
+
+from sqlalchemy import inspect, text
+
+from app.models.database import DATABASE_URL, engine, metadata
+from app.models.meeting import MeetingParticipant, MeetingSummary, MeetingTranscript
+
+CHILD_TABLES = [
+    MeetingParticipant.__table__,
+    MeetingTranscript.__table__,
+    MeetingSummary.__table__,
+]
+
+def _add_revision(conn, inspector):
+    columns = {c["name"] for c in inspector.get_columns("meetings")}
+    if "revision" not in columns:
+        conn.execute(text("ALTER TABLE meetings ADD COLUMN revision BIGINT NOT NULL DEFAULT 0"))
+
+def _migrate_sqlite(conn):
+    inspector = inspect(conn)
+    if not inspector.has_table("meetings"):
+        return
+
+    # Foreign keys off while parent and child ids are rewritten
+    conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+    conn.execute(text("UPDATE meetings SET id = replace(id, '-', '') WHERE length(id) = 36"))
+
+    for table in CHILD_TABLES:
+        if not inspector.has_table(table.name):
+            continue
+        # SQLite can't alter a foreign key, so rebuild the table from the model and copy rows across
+        old_name = f"_old_{table.name}"
+        old_columns = [c["name"] for c in inspector.get_columns(table.name)]
+        for index in inspector.get_indexes(table.name):
+            conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{index["name"]}"')
+        conn.exec_driver_sql(f'ALTER TABLE "{table.name}" RENAME TO "{old_name}"')
+        table.create(conn)
+
+        columns = [c.name for c in table.columns if c.name in old_columns]
+        select = []
+        for name in columns:
+            if name == "meeting_id":
+                select.append("replace(meeting_id, '-', '')")
+            elif name == "created_at":
+                # Now NOT NULL with a server default
+                select.append("COALESCE(created_at, CURRENT_TIMESTAMP)")
+            else:
+                select.append(f'"{name}"')
+        conn.exec_driver_sql(
+            f'INSERT INTO "{table.name}" ({", ".join(columns)}) '
+            f'SELECT {", ".join(select)} FROM "{old_name}"'
+        )
+        conn.exec_driver_sql(f'DROP TABLE "{old_name}"')
+
+    _add_revision(conn, inspector)
+
+def _migrate_postgresql(conn):
+    inspector = inspect(conn)
+    if not inspector.has_table("meetings"):
+        return
+
+    id_type = next(c["type"] for c in inspector.get_columns("meetings") if c["name"] == "id")
+    if id_type.__visit_name__.upper() != "UUID":
+        children = [t for t in CHILD_TABLES if inspector.has_table(t.name)]
+        for table in children:
+            for fk in inspector.get_foreign_keys(table.name):
+                if fk["referred_table"] == "meetings":
+                    conn.execute(text(f'ALTER TABLE "{table.name}" DROP CONSTRAINT "{fk["name"]}"'))
+
+        conn.execute(text("ALTER TABLE meetings ALTER COLUMN id TYPE uuid USING id::uuid"))
+        for table in children:
+            conn.execute(text(
+                f'ALTER TABLE "{table.name}" ALTER COLUMN meeting_id TYPE uuid USING meeting_id::uuid'
+            ))
+            conn.execute(text(
+                f'ALTER TABLE "{table.name}" ADD CONSTRAINT "fk_{table.name}_meeting_id_meetings" '
+                f'FOREIGN KEY (meeting_id) REFERENCES meetings (id) ON DELETE CASCADE'
+            ))
+
+    _add_revision(conn, inspector)
+
+async def migrate():
+    try:
+        async with engine.begin() as conn:
+            if DATABASE_URL.startswith("sqlite"):
+                await conn.run_sync(_migrate_sqlite)
+            else:
+                await conn.run_sync(_migrate_postgresql)
+            # Create any tables added since the database was first built
+            await conn.run_sync(metadata.create_all)
+
+        print("✅ Meeting id migration completed!")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(migrate())